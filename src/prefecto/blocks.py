@@ -5,7 +5,8 @@ The `@lazy_load` decorator is centered around a model to attach blocks to. Each
 is defined with two parts: a block name and a block property. The block name is a
 string that identifies the block. The block property is a property that loads the block
 on first access. The block property should be decorated with the `@lazy_load` decorator,
-and the block's type should be specified in the property annotations.
+and the block's type should be specified in the property annotations. After the first
+access, the block is an ordinary instance attribute.
 
 Example:
 
@@ -20,7 +21,6 @@ class Blocks:
     # Define the block name variables
     password_block: str = "secret-password"
 
-    @property
     @lazy_load("password_block")
     def password(self) -> Secret:
         \"""The password block.\"""
@@ -40,7 +40,9 @@ would load the block every time it is called and could lead to performance issue
 
 The loader can be integrated with `pydantic-settings` to load block names from
 environment variables. This can be achieved by setting the block name variables
-as class variables with default values set to the environment variables.
+as class variables with default values set to the environment variables. Pydantic models
+only allow properties as non-field attributes, so the loader must also be wrapped in
+`@property`.
 
 Example:
 
@@ -70,16 +72,18 @@ class Blocks(BaseSettings):
 import asyncio
 import functools
 import types
-from typing import Union, get_args, get_origin
+from typing import Any, Coroutine, Union, get_args, get_origin
 
-from prefect._internal.concurrency.api import from_sync
+from prefect._internal.concurrency.api import create_call, from_sync
 from prefect.blocks.abstract import Block
-from prefect.utilities.asyncutils import sync_compatible
+
+# Sentinel for a block that has not been loaded yet. Blocks can be falsy, so the
+# cache cannot be checked by truthiness.
+_MISSING = object()
 
 
-@sync_compatible
-async def load_block(block_type: type[Block], block_name: str) -> Block:
-    """Load a block.
+async def _load_block_async(block_type: type[Block], block_name: str) -> Block:
+    """Load a block asynchronously.
 
     Args:
         block_type (type[Block]): The block type.
@@ -92,6 +96,114 @@ async def load_block(block_type: type[Block], block_name: str) -> Block:
     return (await block) if asyncio.iscoroutine(block) else block
 
 
+def load_block(
+    block_type: type[Block], block_name: str, _sync: bool | None = None
+) -> Block | Coroutine[Any, Any, Block]:
+    """Load a block. Returns a coroutine to await when called from a running event
+    loop, otherwise loads the block in Prefect's event loop thread and returns it.
+
+    Like a `sync_compatible` function, the coroutine is also available as
+    `load_block.aio`.
+
+    Args:
+        block_type (type[Block]): The block type.
+        block_name (str): The block name.
+        _sync (bool, optional): `True` to always return the block, `False` to always
+            return a coroutine. Detected from the calling context by default.
+    """
+    if _sync is None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            _sync = True
+        else:
+            _sync = False
+    if not _sync:
+        return _load_block_async(block_type, block_name)
+    return from_sync.call_soon_in_loop_thread(
+        create_call(_load_block_async, block_type, block_name)
+    ).result()
+
+
+load_block.aio = _load_block_async
+
+
+async def _resolve(coro: Coroutine[Any, Any, Block]) -> Block:
+    """Await a coroutine that loads a block.
+
+    Args:
+        coro (Coroutine): The coroutine returned by `load_block`.
+    """
+    return await coro
+
+
+class LazyBlockProperty:
+    """A descriptor that loads a block on first access and caches it on the instance.
+
+    Created by the `@lazy_load` decorator. When set directly on a class, the block is
+    stored in the instance `__dict__` under the attribute's own name, so later
+    accesses skip the descriptor entirely. It can also be wrapped in `@property`,
+    which Pydantic models require, in which case the block is cached under
+    `block_varname`.
+
+    Args:
+        func (Callable): The decorated loader. Its return annotation is the block type.
+        varname (str): The variable name of the block name var.
+
+    Raises:
+        TypeError: If the return annotation is a union or not a subclass of `Block`.
+    """
+
+    def __init__(self, func, varname: str):
+        block_type = func.__annotations__["return"]
+
+        if (get_origin(block_type) is Union) or isinstance(block_type, types.UnionType):
+            raise TypeError(
+                f"Only one block type can be specified for a block property. Received: {get_args(block_type)}",
+            )
+        elif isinstance(block_type, type) and not issubclass(block_type, Block):
+            raise TypeError(
+                f"The block type must be a subclass of Block. Received: {block_type}",
+            )
+
+        functools.update_wrapper(self, func)
+        self.varname = varname
+        self.block_type = block_type
+        self.block_varname = f"_{func.__name__}_block"
+        self.attrname = func.__name__
+
+    def __set_name__(self, owner: type, name: str):
+        """Record the attribute name the descriptor is assigned to."""
+        self.attrname = name
+
+    def __get__(self, instance, owner: type | None = None):
+        """Load the block and shadow the descriptor with it on the instance."""
+        if instance is None:
+            return self
+        block = self._load(instance)
+        instance.__dict__[self.attrname] = block
+        return block
+
+    def __call__(self, instance):
+        """Load the block when wrapped in a `property`."""
+        block = instance.__dict__.get(self.block_varname, _MISSING)
+        if block is _MISSING:
+            block = self._load(instance)
+            instance.__dict__[self.block_varname] = block
+        return block
+
+    def _load(self, instance) -> Block:
+        """Load the block named by the instance's `varname` attribute."""
+        block = load_block(self.block_type, getattr(instance, self.varname))
+        if asyncio.iscoroutine(block):
+            # This is a workaround for a case where the block is first accessed
+            # within an asynchronous flow. In that case, `load_block` will return a
+            # coroutine object instead of the block.
+            # This will await the coroutine in the loop thread to get the block.
+            block = from_sync.call_in_loop_thread(create_call(_resolve, block))
+        return block
+
+
 def lazy_load(varname: str):
     """Decorator for lazy loading a block.
 
@@ -103,55 +215,23 @@ def lazy_load(varname: str):
 
     Example:
 
-    Specify the block name, then create a decorated property to load the block on
+    Specify the block name, then create a decorated loader to load the block on
     first access.
 
     ```python
     class MyClass:
         block_name = "block_name"
 
-        @property
         @lazy_load("block_name")
         def block(self) -> BlockType:
             \"""The block.\"""
     ```
+
+    On Pydantic models, wrap the loader in `@property` as well.
     """
 
-    def decorator(func):
+    def decorator(func) -> LazyBlockProperty:
         """Decorator for the loader."""
-
-        block_type = func.__annotations__["return"]
-
-        if (get_origin(block_type) is Union) or isinstance(block_type, types.UnionType):
-            raise TypeError(
-                f"Only one block type can be specified for a block property. Received: {get_args(block_type)}",
-            )
-        elif isinstance(block_type, type) and not issubclass(block_type, Block):
-            raise TypeError(
-                f"The block type must be a subclass of Block. Received: {block_type}",
-            )
-
-        block_varname = f"_{func.__name__}_block"
-
-        @functools.wraps(func)
-        def lazy_property(self):
-            """Lazy property loader for a block."""
-            block = getattr(self, block_varname, None)
-            if not block:
-                block = load_block(block_type, getattr(self, varname))
-                if asyncio.iscoroutine(block):
-                    # This is a workaround for a case where the block is first accessed
-                    # within an asynchronous flow. In that case, the @sync_compatible
-                    # decorator will return a coroutine object instead of the block.
-                    # This will run the coroutine in the loop thread to get the block.
-                    block = from_sync.call_in_loop_thread(lambda: block)
-                setattr(self, block_varname, block)
-            return block
-
-        lazy_property.varname = varname
-        lazy_property.block_type = block_type
-        lazy_property.block_varname = block_varname
-
-        return lazy_property
+        return LazyBlockProperty(func, varname)
 
     return decorator
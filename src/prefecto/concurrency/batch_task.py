@@ -4,17 +4,36 @@ Module to improve Prefect concurrency operations.
 
 from __future__ import annotations
 
-from typing import TypeVar
+import asyncio
+import functools
+import inspect
+import sys
+import time
+from collections import deque
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+    TypeVar,
+)
 
 from prefect import unmapped
-from prefect.futures import PrefectFuture
-from prefect.tasks import Task
-from prefect.utilities.callables import get_call_parameters
+from prefect.exceptions import ParameterBindError
 from typing_extensions import ParamSpec
 
-from prefecto import logging, states
+from prefecto import logging
 from prefecto.concurrency.kill_switch import KillSwitch
 
+if TYPE_CHECKING:
+    from prefect.futures import PrefectFuture
+    from prefect.states import State
+    from prefect.tasks import Task
+
 T = TypeVar("T")  # Generic type var for capturing the inner return type of async funcs
 R = TypeVar("R")  # The return type of the user's function
 P = ParamSpec("P")  # The parameters of the task
@@ -24,6 +43,95 @@ MapArgument = list[P_i] | unmapped[P_i]
 Batch = dict[str, MapArgument]
 
 
+async def _maybe_await(value: T | Awaitable[T]) -> T:
+    """Await the value if it is awaitable. Async tasks and their futures return
+    awaitables in asynchronous flows, sync tasks and their futures do not.
+    """
+    return (await value) if inspect.isawaitable(value) else value
+
+
+def _wait_off_loop(future: PrefectFuture) -> Awaitable[State]:
+    """Wait on a future without blocking the running event loop. The futures of sync
+    tasks block their caller, so they are waited on in a worker thread.
+    """
+    if future.asynchronous:
+        return future.wait()
+    return asyncio.to_thread(future.wait)
+
+
+def _take(iterator: Iterator, start: int, stop: int) -> list:
+    """Take the next `stop - start` items of an iterator."""
+    return list(islice(iterator, stop - start))
+
+
+def _native_slicer(value: Any) -> Callable[[int, int], Any] | None:
+    """Get a function that slices `value` natively when it is a list, a NumPy array,
+    or a pandas or Polars series. Arrays and series are sliced into views. Returns
+    `None` for any other type.
+
+    The libraries are optional. They are only checked for if already imported, since
+    a value of their types cannot exist otherwise.
+    """
+    if isinstance(value, list):
+        return lambda start, stop: value[start:stop]
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(value, np.ndarray):
+        return lambda start, stop: value[start:stop]
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(value, pd.Series):
+        return lambda start, stop: value.iloc[start:stop]
+    pl = sys.modules.get("polars")
+    if pl is not None and isinstance(value, pl.Series):
+        return lambda start, stop: value.slice(start, stop - start)
+    return None
+
+
+class _SizeTuner:
+    """Adapts the batch size so that each batch takes about `target_seconds`, from
+    the observed duration of finished batches. The size at most doubles per finished
+    batch, so one unusually quick batch cannot flood the task runner.
+
+    Args:
+        size (int): The initial batch size.
+        target_seconds (float): The target duration of a batch.
+        max_size (int, optional): The largest batch size to grow to.
+    """
+
+    def __init__(self, size: int, target_seconds: float, max_size: int | None = None):
+        self.size = size
+        self.target_seconds = target_seconds
+        self.max_size = max_size
+        # The length and submission time of each unfinished batch, oldest first
+        self._pending: deque[tuple[int, float]] = deque()
+        # Whether the last stop has been yielded
+        self.exhausted = False
+
+    def stops(self, length: int) -> Iterator[int]:
+        """Yield the stop index of each batch, sized by the latest estimate."""
+        stop = 0
+        while stop < length:
+            stop += self.size
+            self.exhausted = stop >= length
+            yield stop
+
+    def submitted(self, n: int):
+        """Record the submission of a batch of `n` items."""
+        self._pending.append((n, time.monotonic()))
+
+    def finished(self):
+        """Record that the oldest unfinished batch finished and resize from its
+        duration.
+        """
+        n, t0 = self._pending.popleft()
+        elapsed = time.monotonic() - t0
+        if elapsed <= 0:
+            return
+        size = min(int(n * self.target_seconds / elapsed), 2 * self.size)
+        if self.max_size is not None:
+            size = min(size, self.max_size)
+        self.size = max(1, size)
+
+
 class BatchTask:
     """Wraps a `Task` to perform `Task.map` in batches, reducing the number of
     concurrent tasks, mellowing Prefect API requests, and allowing for faster
@@ -65,10 +173,68 @@ class BatchTask:
 
     See [kill switches][src.prefecto.concurrency.kill_switch] for more information.
 
+    When the right `size` is hard to know ahead of time, `auto_tune` resizes the
+    batches of each `map` call from the duration of the finished ones, aiming for
+    batches that take `target_batch_seconds`. `size` is used for the first batches,
+    and each finished batch can at most double the size, up to `max_size`.
+
+    ```python
+    from prefect import flow, task
+    from prefecto.concurrency import BatchTask
+
+    @task
+    def add(a, b):
+        return a + b
+
+    @flow
+    def my_flow():
+        batch_add = BatchTask(
+            add, 10, auto_tune=True, target_batch_seconds=5, max_size=100
+        )
+        return batch_add.map(list(range(1000)), list(range(1000)))
+
+    ```
+
+    When items vary in how much work they are, batches can be packed by weight
+    instead of by count. Each batch is closed once the weights of its `weight_param`
+    values reach `target_weight`, or once it holds `size` items.
+
+    ```python
+    from prefect import flow, task
+    from prefecto.concurrency import BatchTask
+
+    @task
+    def download(url, size_mb):
+        ...
+
+    @flow
+    def my_flow(urls: list[str], sizes_mb: list[int]):
+        batch_download = BatchTask(
+            download,
+            100,
+            weight_fn=lambda mb: mb,
+            target_weight=500,
+            weight_param="size_mb",
+        )
+        return batch_download.map(urls, sizes_mb)
+
+    ```
+
     """
 
     def __init__(
-        self, task: Task[P, R], size: int, kill_switch: KillSwitch | None = None
+        self,
+        task: Task[P, R],
+        size: int,
+        kill_switch: KillSwitch | None = None,
+        lookahead: int = 1,
+        *,
+        weight_fn: Callable[[Any], float] | None = None,
+        target_weight: float | None = None,
+        weight_param: str | None = None,
+        auto_tune: bool = False,
+        target_batch_seconds: float | None = None,
+        max_size: int | None = None,
     ):
         """Wrap the `task` to be executed in batches of `size`.
 
@@ -78,9 +244,41 @@ class BatchTask:
                 size (int): The size of the batches to perform `Task.map` on.
                 kill_switch (KillSwitch, optional): A kill switch to stop the execution of the task
                     after a certain condition is met.
+                lookahead (int, optional): The number of batches that may be submitted
+                    ahead of the oldest unfinished batch. At most `(lookahead + 1) * size`
+                    tasks are in flight at once. `0` waits for each batch to finish
+                    before submitting the next. Small values (1 to 3) usually hide
+                    submission latency without flooding the Prefect API.
+                weight_fn (Callable, optional): A function that gets the weight of a
+                    `weight_param` value. Batches are packed by weight instead of by
+                    count, with `size` as the maximum number of items in a batch.
+                target_weight (float, optional): The total weight at which a batch is
+                    closed. Required with `weight_fn`.
+                weight_param (str, optional): The name of the mapped task parameter to
+                    weigh. Required with `weight_fn`.
+                auto_tune (bool, optional): Resize the batches from the duration of the
+                    finished ones. `size` is the initial size. Cannot be combined with
+                    `weight_fn`.
+                target_batch_seconds (float, optional): The duration `auto_tune` aims
+                    for each batch to take. Defaults to 30 seconds. Requires
+                    `auto_tune`.
+                max_size (int, optional): The largest batch size `auto_tune` may grow
+                    to. Batches at most double in size per finished batch either way.
+                    Requires `auto_tune`.
         """
         self.task: Task = task
         self.size: int = size
+        # The task function is fixed, so only inspect its signature once
+        self._signature: inspect.Signature = inspect.signature(task.fn)
+        if not isinstance(lookahead, int) or isinstance(lookahead, bool):
+            raise TypeError(
+                f"Expected 'lookahead' to be an int, got {type(lookahead)}."
+            )
+        if lookahead < 0:
+            raise ValueError(
+                f"Expected 'lookahead' to be non-negative, got {lookahead}."
+            )
+        self.lookahead: int = lookahead
 
         if kill_switch is not None and not isinstance(kill_switch, KillSwitch):
             raise TypeError(
@@ -88,8 +286,80 @@ class BatchTask:
             )
         self._kill_switch = kill_switch
 
-    def _make_batches(self, **params: MapArgument) -> list[Batch]:
-        """Create batches of arguments to pass to the `Task.map` calls.
+        if weight_fn is None and (
+            target_weight is not None or weight_param is not None
+        ):
+            raise ValueError(
+                "'target_weight' and 'weight_param' require a 'weight_fn'."
+            )
+        if weight_fn is not None and (target_weight is None or weight_param is None):
+            raise ValueError(
+                "'weight_fn' requires a 'target_weight' and a 'weight_param'."
+            )
+        self.weight_fn: Callable[[Any], float] | None = weight_fn
+        self.target_weight: float | None = target_weight
+        self.weight_param: str | None = weight_param
+
+        if not auto_tune and (target_batch_seconds is not None or max_size is not None):
+            raise ValueError(
+                "'target_batch_seconds' and 'max_size' require 'auto_tune'."
+            )
+        if auto_tune and weight_fn is not None:
+            raise ValueError("'auto_tune' cannot be combined with a 'weight_fn'.")
+        if target_batch_seconds is None:
+            target_batch_seconds = 30.0
+        elif target_batch_seconds <= 0:
+            raise ValueError(
+                f"Expected 'target_batch_seconds' to be positive, got {target_batch_seconds}."
+            )
+        if max_size is not None and max_size < size:
+            raise ValueError(
+                f"Expected 'max_size' to be at least 'size' ({size}), got {max_size}."
+            )
+        self.auto_tune: bool = auto_tune
+        self.target_batch_seconds: float = target_batch_seconds
+        self.max_size: int | None = max_size
+
+    def _get_length(self, params: dict[str, MapArgument]) -> int:
+        """Validate the arguments to batch and get their common length.
+
+        Args:
+            params (dict[str, MapArgument]): Keyword arguments where each value is an
+            iterable of equal length or an `unmapped` object. Should be at least
+            one non-`unmapped` argument.
+
+        Returns:
+            The length of the non-`unmapped` iterables.
+
+        Raises:
+            ValueError: If the arguments cannot be batched.
+        """
+        if len(params) == 0:
+            raise ValueError("Must provide at least one iterable.")
+
+        # Validate all are iterables and the non-unmapped ones are of equal length
+        length: int | None = None
+        for k, v in params.items():
+            if not hasattr(v, "__iter__"):
+                raise ValueError(f"Expected '{k}' to be an iterable.")
+            if isinstance(v, unmapped):
+                continue
+            if length is None:
+                first, length = k, len(v)
+            elif len(v) != length:
+                raise ValueError(
+                    f"Expected all iterables to be of length {length} like "
+                    f"'{first}'. '{k}' is length {len(v)}."
+                )
+
+        if length is None:
+            # Logically, at least one iterable must be provided
+            raise ValueError("Must provide at least one non-unmapped iterable.")
+        return length
+
+    def _make_batches(self, **params: MapArgument) -> Iterator[Batch]:
+        """Create batches of arguments to pass to the `Task.map` calls. The arguments
+        are validated immediately, the batches are created as they are iterated.
 
         Args:
             **params (MapArgument): Keyword arguments where each value is an
@@ -97,15 +367,18 @@ class BatchTask:
             one non-`unmapped` argument.
 
         Returns:
-            (list[dict[str, list[P_i] | unmapped[P_i]]]): A list of dictionaries where each
-            dictionary has the same keys as the provided keyword arguments.
+            (Iterator[dict[str, list[P_i] | unmapped[P_i]]]): An iterator of dictionaries
+            where each dictionary has the same keys as the provided keyword arguments.
             The values of the dictionaries are lists with lengths no greater
-            than `BatchTask.size`.
+            than `BatchTask.size`. NumPy arrays and pandas or Polars series are
+            sliced into views of their own type instead. If everything fits in one
+            batch, it holds the arguments as given. With a `BatchTask.weight_fn`,
+            the lengths vary by the weights of the items.
 
         Examples:
 
             ```python
-            BatchTask(task, 3)._make_batches(a=[1,2,3,4,5], b=[2,3,4,5,6])
+            list(BatchTask(task, 3)._make_batches(a=[1,2,3,4,5], b=[2,3,4,5,6]))
             ```
             ```json
             [
@@ -114,59 +387,87 @@ class BatchTask:
             ]
             ```
         """
-        parameters = sorted(params.keys())
-        if len(parameters) == 0:
-            raise ValueError("Must provide at least one iterable.")
+        return self._iter_batches(
+            params, self._get_stops(params, self._get_length(params))
+        )
 
-        # Validate all are iterables
-        for k in parameters:
-            if not hasattr(params[k], "__iter__"):
-                raise ValueError(f"Expected '{k}' to be an iterable.")
+    def _get_stops(self, params: dict[str, MapArgument], length: int) -> Sequence[int]:
+        """Get the index after the last item of each batch. In count mode, the last
+        stop may exceed `length`.
 
-        # Get the first non-unmapped iterable
-        length: int
-        for j, name in enumerate(parameters):
-            if not isinstance(params[name], unmapped):
-                length = len(params[name])
-                break
-        else:
-            # Logically, at least one iterable must be provided
-            raise ValueError("Must provide at least one non-unmapped iterable.")
+        Args:
+            params (dict[str, MapArgument]): The validated arguments.
+            length (int): The length of the non-`unmapped` iterables.
 
-        # Assure all of equal length
-        if len(parameters[j:]) > 1:
-            for k in parameters[j + 1 :]:
-                if not isinstance(params[k], unmapped) and not len(params[k]) == length:
-                    raise ValueError(
-                        f"Expected all iterables to be of length {length} like "
-                        f"'{parameters[j]}'. '{k}' is length {len(params[k])}."
-                    )
+        Returns:
+            The stop index of each batch.
 
-        batches = []
+        Raises:
+            ValueError: If `BatchTask.weight_param` is not a mapped argument.
+        """
+        if self.weight_fn is None:
+            return range(self.size, length + self.size, self.size)
 
-        i = 0
-        for i in range(length // self.size):
-            batch = {p: [] for p in parameters}
-            for p in parameters:
-                if isinstance(params[p], unmapped):
-                    # Pass the unmapped argument to be handled by the task
-                    batch[p] = params[p]
-                else:
-                    batch[p] = params[p][i * self.size : (i + 1) * self.size]
-            batches.append(batch)
-
-        # Add the remainder if there is one
-        if length % self.size != 0:
-            batch = {p: [] for p in parameters}
-            for p in parameters:
-                if isinstance(params[p], unmapped):
-                    # Pass the unmapped argument to be handled by the task
-                    batch[p] = params[p]
-                else:
-                    batch[p] = params[p][(length // self.size) * self.size :]
-            batches.append(batch)
-
-        return batches
+        values = params.get(self.weight_param)
+        if values is None or isinstance(values, unmapped):
+            raise ValueError(
+                f"Expected 'weight_param' '{self.weight_param}' to be a mapped argument."
+            )
+        stops = []
+        start = 0
+        weight = 0
+        for i, value in enumerate(values, 1):
+            weight += self.weight_fn(value)
+            if weight >= self.target_weight or i - start == self.size:
+                stops.append(i)
+                start, weight = i, 0
+        if start < length:
+            stops.append(length)
+        return stops
+
+    def _iter_batches(
+        self, params: dict[str, MapArgument], stops: Iterable[int]
+    ) -> Iterator[Batch]:
+        """Yield batches of validated arguments.
+
+        Args:
+            params (dict[str, MapArgument]): The validated arguments.
+            stops (Iterable[int]): The stop index of each batch. May be lazy, in
+                which case each stop is drawn as its batch is built.
+
+        Yields:
+            The batches of arguments.
+        """
+        if isinstance(stops, Sequence) and len(stops) == 1:
+            # Everything fits in one batch, so pass the arguments through as given
+            yield dict(params)
+            return
+
+        # Slice lists, arrays and series natively, draw any other iterable from one
+        # iterator
+        slicers: dict[str, Callable[[int, int], Any]] = {}
+        for p, v in params.items():
+            if isinstance(v, unmapped):
+                continue
+            slicer = _native_slicer(v)
+            if slicer is None:
+                slicer = functools.partial(_take, iter(v))
+            slicers[p] = slicer
+
+        # Pass the unmapped arguments to be handled by the task. They are the same for
+        # every batch, so each batch starts as a copy of the template.
+        template = {
+            p: v if isinstance(v, unmapped) else None for p, v in params.items()
+        }
+        names = tuple(slicers)
+        funcs = tuple(slicers.values())
+        start = 0
+        for stop in stops:
+            # Slicing past the end is safe, so the last stop is not clamped
+            batch = template.copy()
+            batch.update(zip(names, [f(start, stop) for f in funcs]))
+            yield batch
+            start = stop
 
     def map(self, *args: MapArgument, **kwds: MapArgument) -> list[PrefectFuture]:
         """Perform a `Task.map` operation in batches of the keyword arguments. The
@@ -222,45 +523,235 @@ class BatchTask:
             [3, 5, 7, 9]
             ```
         """
-        parameters = get_call_parameters(self.task.fn, args, kwds, apply_defaults=False)
-        batches = self._make_batches(**parameters)
+        parameters = self._bind(args, kwds)
+        length = self._get_length(parameters)
+        if self.auto_tune and length > self.size:
+            tuner = _SizeTuner(self.size, self.target_batch_seconds, self.max_size)
+            batches = self._iter_batches(parameters, tuner.stops(length))
+            return self._map(batches, None, tuner)
+        stops = self._get_stops(parameters, length)
+
+        return self._map(self._iter_batches(parameters, stops), len(stops))
+
+    async def amap(
+        self, *args: MapArgument, **kwds: MapArgument
+    ) -> list[PrefectFuture]:
+        """Perform a `Task.map` operation in batches from an asynchronous flow. Behaves
+        like `BatchTask.map`, but waits on batches without blocking the event loop.
+
+        Futures of synchronous tasks are waited on in the event loop's default
+        executor, which runs at most `min(32, os.cpu_count() + 4)` waits at a time. A
+        kill switch sees the states in the order they finish among the running waits,
+        and waits abandoned after it triggers hold their threads until their tasks
+        finish.
+
+        Args:
+
+            *args: Positional arguments to pass to the task.
+            **kwds: Keyword arguments to pass to the task.
+
+        Returns:
+            A list of futures for each batch.
+
+        Examples:
+
+            ```python
+            from prefect import flow, task
+            from prefecto.concurrency import BatchTask
+
+            @task
+            def add(a, b):
+                return a + b
+
+            @flow
+            async def my_flow():
+                batch_add = BatchTask(add, 2)
+                return await batch_add.amap([1,2,3,4], [2,3,4,5])
+
+            ```
+        """
+        parameters = self._bind(args, kwds)
+        length = self._get_length(parameters)
+        if self.auto_tune and length > self.size:
+            tuner = _SizeTuner(self.size, self.target_batch_seconds, self.max_size)
+            batches = self._iter_batches(parameters, tuner.stops(length))
+            return await self._amap(batches, None, tuner)
+        stops = self._get_stops(parameters, length)
 
-        return self._map(batches)
+        return await self._amap(self._iter_batches(parameters, stops), len(stops))
 
-    def _map(self, batches: list[Batch]) -> list[PrefectFuture]:
+    def _bind(self, args: tuple, kwds: dict) -> dict[str, MapArgument]:
+        """Bind the arguments of a `map` call to the task's parameters.
+
+        Raises:
+            ParameterBindError: If the arguments do not match the task's signature.
+        """
+        try:
+            return dict(self._signature.bind(*args, **kwds).arguments)
+        except TypeError as exc:
+            raise ParameterBindError.from_bind_failure(self.task.fn, exc, args, kwds)
+
+    def _wait_terminal(self, futures: list[PrefectFuture]):
+        """Block until every future is in a terminal state. Waits on the task runner's
+        completion of each future rather than polling their states.
+
+        Args:
+            futures (list[PrefectFuture]): The futures to wait on.
+        """
+        for f in futures:
+            f.wait()
+
+    def _wait_batch(self, futures: list[PrefectFuture]):
+        """Wait on a batch of futures and check them against the kill switch.
+
+        Args:
+            futures (list[PrefectFuture]): The futures of the batch.
+
+        Raises:
+            KillSwitchError: If the kill switch is triggered by the batch.
+        """
+        if self._kill_switch is None:
+            self._wait_terminal(futures)
+            return
+        # Check each final state as soon as it is reached so the switch can trigger
+        # without waiting on the rest of the batch
+        raise_if_triggered = self._kill_switch.raise_if_triggered
+        for f in futures:
+            raise_if_triggered(f.wait())
+
+    def _map(
+        self,
+        batches: Iterable[Batch],
+        n_batches: int | None,
+        tuner: _SizeTuner | None = None,
+    ) -> list[PrefectFuture]:
         """Applies `Task.map` to each batch.
 
         Args:
-            batches (list[Batch]): Batches of arguments to pass to
+            batches (Iterable[Batch]): Batches of arguments to pass to
             `Task.map`.
+            n_batches (int | None): The number of batches, or `None` if it is not
+                known ahead of time. Must be given without a `tuner`.
+            tuner (_SizeTuner, optional): Informed of the submission and completion of
+                each batch to resize the batches yet to be built.
 
         Returns:
             A list of futures for each batch.
         """
-        if len(batches) == 0:
+        if n_batches == 0:
             return []
         logger = logging.get_prefect_or_default_logger()
+        total = "" if n_batches is None else f" of {n_batches}"
         results: list[PrefectFuture] = []
-        for i, batch in enumerate(batches[:-1]):
-            logger.debug(f"Mapping {self.task.name} batch {i+1} of {len(batches)}.")
-            # Map the batch
+        inflight: deque[list[PrefectFuture]] = deque()
+        batches = iter(batches)
+        i = 0
+        while (i < n_batches) if tuner is None else (not tuner.exhausted):
+            # Wait on the oldest batch once the look-ahead window is full, before the
+            # next batch is built so that the tuner can resize it
+            if len(inflight) > self.lookahead:
+                self._wait_batch(inflight.popleft())
+                if tuner is not None:
+                    tuner.finished()
+            batch = next(batches)
+            logger.debug("Mapping %s batch %d%s.", self.task.name, i + 1, total)
             futures = self.task.map(**batch)
+            if tuner is not None:
+                tuner.submitted(len(futures))
             results.extend(futures)
-            # Poll futures to ensure they are not active.
-            is_processing: bool = True
-            while is_processing:
-                # If any future is still processing, loop and poll again.
-                # If all futures are terminal, break while loop and continue
-                if all(states.is_terminal(f.get_state()) for f in futures):
-                    is_processing = False
-
-            if self._kill_switch is not None:
-                for f in futures:
-                    self._kill_switch.raise_if_triggered(f.get_state())
-
-        # Map the last batch
-        logger.debug(
-            f"Mapping {self.task.name} batch {len(batches)} of {len(batches)}."
-        )
-        results.extend(self.task.map(**batches[-1]))
+            inflight.append(futures)
+            i += 1
+
+        # The last batch is returned without waiting on it
+        inflight.pop()
+        while inflight:
+            self._wait_batch(inflight.popleft())
+        return results
+
+    async def _await_terminal(self, futures: list[PrefectFuture]):
+        """Asynchronous `BatchTask._wait_terminal`.
+
+        Args:
+            futures (list[PrefectFuture]): The futures to wait on.
+        """
+        for f in futures:
+            await _wait_off_loop(f)
+
+    async def _await_batch(self, futures: list[PrefectFuture]):
+        """Asynchronous `BatchTask._wait_batch`.
+
+        Args:
+            futures (list[PrefectFuture]): The futures of the batch.
+
+        Raises:
+            KillSwitchError: If the kill switch is triggered by the batch.
+        """
+        if self._kill_switch is None:
+            await self._await_terminal(futures)
+            return
+        raise_if_triggered = self._kill_switch.raise_if_triggered
+        # Check the states in the order the tasks finish
+        pending = [asyncio.ensure_future(_wait_off_loop(f)) for f in futures]
+        try:
+            for state in asyncio.as_completed(pending):
+                raise_if_triggered(await state)
+        finally:
+            # Stop waiting on the rest once the switch is triggered. Threads already
+            # waiting on sync futures stay busy in the executor until their tasks
+            # finish.
+            for w in pending:
+                w.cancel()
+
+    async def _amap(
+        self,
+        batches: Iterable[Batch],
+        n_batches: int | None,
+        tuner: _SizeTuner | None = None,
+    ) -> list[PrefectFuture]:
+        """Asynchronous `BatchTask._map`.
+
+        Args:
+            batches (Iterable[Batch]): Batches of arguments to pass to
+            `Task.map`.
+            n_batches (int | None): The number of batches, or `None` if it is not
+                known ahead of time. Must be given without a `tuner`.
+            tuner (_SizeTuner, optional): Informed of the submission and completion of
+                each batch to resize the batches yet to be built.
+
+        Returns:
+            A list of futures for each batch.
+        """
+        if n_batches == 0:
+            return []
+        logger = logging.get_prefect_or_default_logger()
+        total = "" if n_batches is None else f" of {n_batches}"
+        results: list[PrefectFuture] = []
+        inflight: deque[list[PrefectFuture]] = deque()
+        batches = iter(batches)
+        i = 0
+        while (i < n_batches) if tuner is None else (not tuner.exhausted):
+            # Wait on the oldest batch once the look-ahead window is full, before the
+            # next batch is built so that the tuner can resize it
+            if len(inflight) > self.lookahead:
+                await self._await_batch(inflight.popleft())
+                if tuner is not None:
+                    tuner.finished()
+            batch = next(batches)
+            logger.debug("Mapping %s batch %d%s.", self.task.name, i + 1, total)
+            if self.task.isasync:
+                futures = await _maybe_await(self.task.map(**batch))
+            else:
+                # Sync tasks are submitted from the calling thread, so keep it off
+                # the loop
+                futures = await asyncio.to_thread(self.task.map, **batch)
+            if tuner is not None:
+                tuner.submitted(len(futures))
+            results.extend(futures)
+            inflight.append(futures)
+            i += 1
+
+        # The last batch is returned without waiting on it
+        inflight.pop()
+        while inflight:
+            await self._await_batch(inflight.popleft())
         return results
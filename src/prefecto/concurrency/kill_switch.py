@@ -5,9 +5,12 @@ Kill switch logic classes for stopping the execution of a
 """
 
 import abc
+from fractions import Fraction
 
 from prefect.states import State
 
+from prefecto.states import is_fail_like
+
 
 class KillSwitchError(Exception):
     """Error raised when a kill switch is activated."""
@@ -37,6 +40,10 @@ class KillSwitch(abc.ABC):
     ```
     """
 
+    # `abc.ABC` defines empty slots, so subclasses that declare their own stay
+    # free of an instance `__dict__`
+    __slots__ = ()
+
     @abc.abstractmethod
     def should_flip_switch(self, state: State) -> bool:
         """Check if this state should flip the kill switch.
@@ -59,9 +66,11 @@ class KillSwitch(abc.ABC):
 class AnyFailedSwitch(KillSwitch):
     """A kill switch that activates if any task fails."""
 
+    __slots__ = ()
+
     def should_flip_switch(self, state: State) -> bool:
         """Check if the state is failed or crashed."""
-        return state.is_failed() or state.is_crashed()
+        return is_fail_like(state)
 
     def raise_if_triggered(self, state: State):
         """Raise a `KillSwitchError` if the state is failed or crashed."""
@@ -78,6 +87,8 @@ class CountSwitch(KillSwitch):
 
     """
 
+    __slots__ = ("max_count", "_current_count")
+
     def __init__(self, max_count: int):
         self.max_count = max_count
         self._current_count = 0
@@ -86,7 +97,7 @@ class CountSwitch(KillSwitch):
         """Increment the count if the state is failed or crashed and return if the count exceeds
         the maximum.
         """
-        if state.is_failed() or state.is_crashed():
+        if is_fail_like(state):
             self._current_count += 1
         return self._current_count >= self.max_count
 
@@ -106,22 +117,37 @@ class RateSwitch(KillSwitch):
 
     """
 
+    __slots__ = (
+        "min_sample",
+        "max_fail_rate",
+        "_current_count",
+        "_failed_count",
+        "_rate_numerator",
+        "_rate_denominator",
+    )
+
     def __init__(self, min_sample: int, max_fail_rate: float):
         self.min_sample = min_sample
         self.max_fail_rate = max_fail_rate
         self._current_count = 0
         self._failed_count = 0
+        # The rate as written, e.g. 0.07 as 7/100, so the threshold is exact
+        rate = Fraction(str(max_fail_rate))
+        self._rate_numerator = rate.numerator
+        self._rate_denominator = rate.denominator
 
     def should_flip_switch(self, state: State) -> bool:
         """Increment the count if the state is failed or crashed and return if the failure rate
         equals or exceeds the max rate.
         """
         self._current_count += 1
-        if state.is_failed() or state.is_crashed():
-            self._failed_count += 1
+        self._failed_count += is_fail_like(state)
+        if self._current_count < self.min_sample:
+            return False
+        # Cross-multiplied in integers to avoid a division or rounding per state
         return (
-            self._current_count >= self.min_sample
-            and self._failed_count / self._current_count >= self.max_fail_rate
+            self._failed_count * self._rate_denominator
+            >= self._rate_numerator * self._current_count
         )
 
     def raise_if_triggered(self, state: State):
@@ -6,8 +6,6 @@ from __future__ import annotations
 
 import logging
 
-from prefect.logging import get_run_logger
-
 
 def get_prefect_or_default_logger(
     __default: logging.Logger | str | None = None,
@@ -21,9 +19,13 @@ def get_prefect_or_default_logger(
             f"Expected `__default` to be a `logging.Logger`, `str`, or `None`, "
             f"got `{type(__default).__name__}`."
         )
-    try:
+    from prefect.context import FlowRunContext, TaskRunContext
+
+    # Check for a run context directly rather than letting `get_run_logger` raise
+    if TaskRunContext.get() or FlowRunContext.get():
+        from prefect.logging import get_run_logger
+
         return get_run_logger()
-    except RuntimeError:
-        if isinstance(__default, str):
-            return logging.getLogger(__default)
-        return __default or logging.getLogger()
+    if isinstance(__default, str):
+        return logging.getLogger(__default)
+    return __default or logging.getLogger()
@@ -7,6 +7,16 @@ from __future__ import annotations
 
 from prefect import states
 
+_TERMINAL_TYPES = frozenset(
+    (
+        states.StateType.CANCELLED,
+        states.StateType.COMPLETED,
+        states.StateType.CRASHED,
+        states.StateType.FAILED,
+    )
+)
+_FAIL_LIKE_TYPES = frozenset((states.StateType.CRASHED, states.StateType.FAILED))
+
 
 def is_terminal(state: states.State) -> bool:
     """Return True if the state is terminal. Terminal states are:
@@ -16,13 +26,13 @@ def is_terminal(state: states.State) -> bool:
     - Crashed
     - Failed
     """
-    TERMINALS = [
-        state.is_cancelled,
-        state.is_completed,
-        state.is_crashed,
-        state.is_failed,
-    ]
-    for terminal in TERMINALS:
-        if terminal():
-            return True
-    return False
+    return state.type in _TERMINAL_TYPES
+
+
+def is_fail_like(state: states.State) -> bool:
+    """Return True if the state is a failure. Failure states are:
+
+    - Crashed
+    - Failed
+    """
+    return state.type in _FAIL_LIKE_TYPES
@@ -5,10 +5,16 @@ Unit tests for the `concurrency` module.
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import threading
+from unittest.mock import MagicMock, patch
+
 import pytest
-from prefect import flow, task, unmapped
+from prefect import flow, states, task, unmapped
+from prefect.exceptions import ParameterBindError
 
-from prefecto.concurrency.batch_task import BatchTask
+from prefecto.concurrency.batch_task import BatchTask, _SizeTuner
 
 
 @task
@@ -23,34 +29,269 @@ def add_many(a, b, c, d):
     return a + b + c + d
 
 
+@task
+def realize(futures: list[int]):
+    """Converts futures to their values."""
+    return futures
+
+
+@flow
+def map_flow(a, b) -> list[int]:
+    """Maps `add` in batches of 3."""
+    futures = BatchTask(add, 3).map(a, b)
+    return realize(futures)
+
+
+@flow
+async def amap_flow(a, b) -> list[int]:
+    """Maps `add` in batches of 3 from an asynchronous flow."""
+    futures = await BatchTask(add, 3).amap(a, b)
+    return realize(futures)
+
+
+# Unmapped sentinels shared by the batching tests
+_UNMAPPED_0, _UNMAPPED_1, _UNMAPPED_2 = unmapped(0), unmapped(1), unmapped(2)
+
+
 class TestBatchTask:
     """Unit tests for `BatchTask`."""
 
     def test_make_batches(self):
         """Test `_make_batches`."""
-        batches = BatchTask(add, 3)._make_batches(a=[1, 2, 3, 4, 5], b=[2, 3, 4, 5, 6])
+        batches = list(
+            BatchTask(add, 3)._make_batches(a=[1, 2, 3, 4, 5], b=[2, 3, 4, 5, 6])
+        )
+        assert batches == [{"a": [1, 2, 3], "b": [2, 3, 4]}, {"a": [4, 5], "b": [5, 6]}]
+
+    @pytest.mark.parametrize("length", [5, 1000, 100_000])
+    def test_make_batches_at_scale(self, length: int):
+        """Test `_make_batches` covers every item exactly once for larger inputs."""
+        a, b = list(range(length)), list(range(1, length + 1))
+        batches = list(BatchTask(add, 3)._make_batches(a=a, b=b))
+        assert len(batches) == -(-length // 3)
+        assert all(len(batch["a"]) == len(batch["b"]) <= 3 for batch in batches)
+        assert [x for batch in batches for x in batch["a"]] == a
+        assert [x for batch in batches for x in batch["b"]] == b
+
+    def test_make_batches_single_batch(self):
+        """Test `_make_batches` passes the arguments through when they fit one batch."""
+        a, b = (1, 2, 3), unmapped(1)
+        (batch,) = BatchTask(add, 3)._make_batches(a=a, b=b)
+        assert batch["a"] is a
+        assert batch["b"] is b
+        assert list(BatchTask(add, 3)._make_batches(a=[], b=[])) == []
+
+    def test_make_batches_by_weight(self):
+        """Test `_make_batches` packs batches by the weights of `weight_param`."""
+        bt = BatchTask(add, 3, weight_fn=lambda x: x, target_weight=5, weight_param="b")
+        batches = list(bt._make_batches(a=[1, 2, 3, 4, 5, 6], b=[4, 2, 1, 1, 1, 6]))
+        assert batches == [
+            {"a": [1, 2], "b": [4, 2]},
+            {"a": [3, 4, 5], "b": [1, 1, 1]},
+            {"a": [6], "b": [6]},
+        ]
+
+        with pytest.raises(
+            ValueError, match="Expected 'weight_param' 'b' to be a mapped argument."
+        ):
+            bt._make_batches(a=[1, 2], b=unmapped(1))
+
+        with pytest.raises(ValueError, match="'weight_fn' requires"):
+            BatchTask(add, 3, weight_fn=len)
+
+        with pytest.raises(ValueError, match="require a 'weight_fn'"):
+            BatchTask(add, 3, target_weight=5)
+
+    def test_make_batches_non_subscriptable(self):
+        """Test `_make_batches` with sized iterables that do not support slicing."""
+        batches = list(
+            BatchTask(add, 3)._make_batches(
+                a=dict.fromkeys([1, 2, 3, 4, 5]).keys(), b=range(2, 7)
+            )
+        )
         assert batches == [{"a": [1, 2, 3], "b": [2, 3, 4]}, {"a": [4, 5], "b": [5, 6]}]
 
     def test_make_batches_with_unmapped(self):
         """Test `_make_batches` with one or more unmapped arguments."""
-        batches = BatchTask(add, 3)._make_batches(a=unmapped(1), b=[2, 3, 4, 5, 6])
+        batches = list(
+            BatchTask(add, 3)._make_batches(a=_UNMAPPED_1, b=[2, 3, 4, 5, 6])
+        )
         assert batches == [
-            {"a": unmapped(1), "b": [2, 3, 4]},
-            {"a": unmapped(1), "b": [5, 6]},
+            {"a": _UNMAPPED_1, "b": [2, 3, 4]},
+            {"a": _UNMAPPED_1, "b": [5, 6]},
         ]
 
-        batches = BatchTask(add_many, 3)._make_batches(
-            a=unmapped(1), b=[2, 3, 4, 5, 6], c=unmapped(0), d=[4, 5, 6, 7, 8]
+        batches = list(
+            BatchTask(add_many, 3)._make_batches(
+                a=_UNMAPPED_1, b=[2, 3, 4, 5, 6], c=_UNMAPPED_0, d=[4, 5, 6, 7, 8]
+            )
         )
         assert batches == [
-            {"a": unmapped(1), "b": [2, 3, 4], "c": unmapped(0), "d": [4, 5, 6]},
-            {"a": unmapped(1), "b": [5, 6], "c": unmapped(0), "d": [7, 8]},
+            {"a": _UNMAPPED_1, "b": [2, 3, 4], "c": _UNMAPPED_0, "d": [4, 5, 6]},
+            {"a": _UNMAPPED_1, "b": [5, 6], "c": _UNMAPPED_0, "d": [7, 8]},
         ]
 
         with pytest.raises(
             ValueError, match="Must provide at least one non-unmapped iterable."
         ):
-            BatchTask(add, 3)._make_batches(a=unmapped(1), b=unmapped(2))
+            BatchTask(add, 3)._make_batches(a=_UNMAPPED_1, b=_UNMAPPED_2)
+
+    def test_make_batches_validation(self):
+        """Test `_make_batches` rejects arguments that cannot be batched."""
+        with pytest.raises(ValueError, match="Must provide at least one iterable."):
+            BatchTask(add, 3)._make_batches()
+
+        with pytest.raises(ValueError, match="Expected 'b' to be an iterable."):
+            BatchTask(add, 3)._make_batches(a=[1, 2], b=1)
+
+        with pytest.raises(
+            ValueError,
+            match="Expected all iterables to be of length 2 like 'b'. 'a' is length 3.",
+        ):
+            BatchTask(add, 3)._make_batches(b=[1, 2], a=[1, 2, 3])
+
+    def test_wait_terminal(self):
+        """Test `_wait_terminal` waits on every future instead of polling states."""
+        futures = [MagicMock(), MagicMock()]
+        BatchTask(add, 3)._wait_terminal(futures)
+        for f in futures:
+            f.wait.assert_called_once_with()
+            f.get_state.assert_not_called()
+
+    def test_wait_batch_stops_on_trigger(self):
+        """Test `_wait_batch` raises on the first triggering state without waiting on
+        the rest of the batch."""
+        from prefecto.concurrency.kill_switch import AnyFailedSwitch, KillSwitchError
+
+        futures = [MagicMock(), MagicMock(), MagicMock()]
+        futures[0].wait.return_value = states.Completed()
+        futures[1].wait.return_value = states.Failed()
+        with pytest.raises(KillSwitchError):
+            BatchTask(add, 3, AnyFailedSwitch())._wait_batch(futures)
+        futures[2].wait.assert_not_called()
+        for f in futures:
+            f.get_state.assert_not_called()
+
+    def test_map_bind_error(self):
+        """Test `map` raises a `ParameterBindError` for arguments the task cannot take."""
+        with pytest.raises(ParameterBindError, match="Error binding parameters"):
+            BatchTask(add, 3).map([1, 2], [3, 4], c=[5, 6])
+
+    def test_init_lookahead_validation(self):
+        """Test `BatchTask` rejects invalid `lookahead` values."""
+        with pytest.raises(TypeError, match="Expected 'lookahead' to be an int"):
+            BatchTask(add, 3, lookahead=1.5)
+        with pytest.raises(ValueError, match="Expected 'lookahead' to be non-negative"):
+            BatchTask(add, 3, lookahead=-1)
+
+    @pytest.mark.parametrize(
+        "lookahead,expectation",
+        [
+            (0, ["map 0", "wait 0", "map 1", "wait 1", "map 2", "wait 2", "map 3"]),
+            (1, ["map 0", "map 1", "wait 0", "map 2", "wait 1", "map 3", "wait 2"]),
+            (5, ["map 0", "map 1", "map 2", "map 3", "wait 0", "wait 1", "wait 2"]),
+        ],
+    )
+    def test_map_lookahead(self, lookahead: int, expectation: list[str]):
+        """Test `_map` keeps at most `lookahead` batches ahead of the oldest batch."""
+        events = []
+        mock_task = MagicMock()
+        mock_task.map.side_effect = lambda x: events.append(f"map {x[0]}") or [x[0]]
+        bt = BatchTask(mock_task, 1, lookahead=lookahead)
+        with patch.object(
+            bt, "_wait_batch", side_effect=lambda f: events.append(f"wait {f[0]}")
+        ):
+            assert bt._map(({"x": [i]} for i in range(4)), 4) == [0, 1, 2, 3]
+        assert events == expectation
+
+    def test_map_logs_batches(self, caplog):
+        """Test `_map` logs each batch it maps."""
+        mock_task = MagicMock()
+        mock_task.name = "mock"
+        mock_task.map.side_effect = lambda x: x
+        bt = BatchTask(mock_task, 1)
+        with caplog.at_level("DEBUG"), patch.object(bt, "_wait_batch"):
+            bt._map(({"x": [i]} for i in range(2)), 2)
+            tuner = _SizeTuner(1, 1.0)
+            bt._map(bt._iter_batches({"x": [0]}, tuner.stops(1)), None, tuner)
+        assert [r.getMessage() for r in caplog.records] == [
+            "Mapping mock batch 1 of 2.",
+            "Mapping mock batch 2 of 2.",
+            "Mapping mock batch 1.",
+        ]
+
+    def test_size_tuner(self):
+        """Test `_SizeTuner` resizes from batch durations and sizes lazily."""
+        tuner = _SizeTuner(10, 1.0)
+        stops = tuner.stops(30)
+        assert next(stops) == 10
+        with patch(
+            "prefecto.concurrency.batch_task.time",
+            **{"monotonic.side_effect": [0.0, 2.0]},
+        ):
+            tuner.submitted(10)
+            tuner.finished()
+        assert tuner.size == 5
+        assert list(stops) == [15, 20, 25, 30]
+
+    def test_size_tuner_caps_growth(self):
+        """Test `_SizeTuner` at most doubles per batch and stops at `max_size`."""
+        tuner = _SizeTuner(10, 30.0, max_size=30)
+        # 10 items in 0.1 seconds would otherwise resize to 3000
+        with patch(
+            "prefecto.concurrency.batch_task.time",
+            **{"monotonic.side_effect": [0.0, 0.1, 0.0, 0.1, 0.0, 0.1]},
+        ):
+            tuner.submitted(10)
+            tuner.finished()
+            assert tuner.size == 20
+            tuner.submitted(20)
+            tuner.finished()
+            assert tuner.size == 30
+            tuner.submitted(30)
+            tuner.finished()
+            assert tuner.size == 30
+
+    def test_map_auto_tune(self):
+        """Test `map` with `auto_tune` grows batches that finish under the target."""
+        sizes = []
+        mock_task = MagicMock(fn=add.fn)
+        mock_task.map.side_effect = lambda a, b: sizes.append(len(a)) or list(a)
+        bt = BatchTask(
+            mock_task, 4, lookahead=0, auto_tune=True, target_batch_seconds=1.0
+        )
+        # Each batch takes half the target, so each finished batch doubles the size
+        # of the next one
+        clock = itertools.count(0, 0.5)
+        with (
+            patch.object(bt, "_wait_batch"),
+            patch(
+                "prefecto.concurrency.batch_task.time",
+                **{"monotonic.side_effect": lambda: next(clock)},
+            ),
+        ):
+            assert bt.map(list(range(30)), list(range(30))) == list(range(30))
+        assert sizes == [4, 8, 16, 2]
+
+    def test_init_auto_tune_validation(self):
+        """Test `BatchTask` rejects invalid `auto_tune` settings."""
+        with pytest.raises(ValueError, match="cannot be combined with a 'weight_fn'"):
+            BatchTask(
+                add,
+                3,
+                auto_tune=True,
+                weight_fn=len,
+                target_weight=5,
+                weight_param="a",
+            )
+        with pytest.raises(ValueError, match="'target_batch_seconds' to be positive"):
+            BatchTask(add, 3, auto_tune=True, target_batch_seconds=0)
+        with pytest.raises(ValueError, match="'max_size' to be at least 'size'"):
+            BatchTask(add, 3, auto_tune=True, max_size=2)
+        with pytest.raises(ValueError, match="require 'auto_tune'"):
+            BatchTask(add, 10, max_size=5)
+        with pytest.raises(ValueError, match="require 'auto_tune'"):
+            BatchTask(add, 10, target_batch_seconds=5)
 
     @pytest.mark.parametrize(
         "a,b,expectation",
@@ -63,20 +304,7 @@ class TestBatchTask:
     )
     def test_map(self, a: list[int], b: list[int], expectation: list[int], harness):
         """Test `BatchTask.map`."""
-
-        @task
-        def realize(futures: list[int]):
-            """Converts futures to their values."""
-            return futures
-
-        @flow
-        def test() -> list[int]:
-            """Test flow."""
-            futures = BatchTask(add, 3).map(a, b)
-            return realize(futures)
-
-        result = test()
-        assert result == expectation
+        assert map_flow(a, b) == expectation
 
     def test_map_with_kill_switch(self, harness):
         """Test `BatchTask.map` with a kill switch."""
@@ -109,3 +337,141 @@ class TestBatchTask:
             assert isinstance(exc.value.ks, CountSwitch)
             assert exc.value.ks._current_count == 2
             assert exc.value.ks._max_count == 2
+
+    @pytest.mark.parametrize(
+        "a,b,expectation",
+        [
+            ([1, 2, 3, 4, 5], [2, 3, 4, 5, 6], [3, 5, 7, 9, 11]),
+            ([], [], []),
+            (unmapped(1), [2, 3, 4, 5, 6], [3, 4, 5, 6, 7]),
+        ],
+    )
+    def test_amap(self, a: list[int], b: list[int], expectation: list[int], harness):
+        """Test `BatchTask.amap`."""
+        assert asyncio.run(amap_flow(a, b)) == expectation
+
+    @pytest.mark.parametrize("kill_switch", [None, "any"])
+    def test_amap_does_not_block_loop(self, kill_switch: str | None, harness):
+        """Test `BatchTask.amap` keeps the event loop running while sync tasks run."""
+        from prefecto.concurrency.kill_switch import AnyFailedSwitch
+
+        started, loop_ran = threading.Event(), threading.Event()
+
+        @task
+        def blocked(x):
+            """Block until the event loop has run while this task was running."""
+            started.set()
+            return loop_ran.wait(timeout=10)
+
+        async def watch_loop():
+            """Mark that the loop ran once a task has started."""
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+            loop_ran.set()
+
+        @flow
+        async def test() -> list[bool]:
+            """Test flow."""
+            switch = AnyFailedSwitch() if kill_switch else None
+            bt = BatchTask(blocked, 1, switch, lookahead=0)
+            watching = asyncio.ensure_future(watch_loop())
+            futures = await bt.amap([1, 2])
+            watching.cancel()
+            return [f.result() for f in futures]
+
+        # A blocked loop could only let the first task finish by timing out
+        assert asyncio.run(test()) == [True, True]
+
+    def test_amap_with_kill_switch(self, harness):
+        """Test `BatchTask.amap` with a kill switch."""
+        from prefecto.concurrency.kill_switch import CountSwitch, KillSwitchError
+
+        @flow
+        async def test():
+            """Test flow."""
+            bt = BatchTask(add, 3, CountSwitch(2))
+            await bt.amap([1, 2, 3, 4, 5, 6, 7, 8, 9], ["x", 1, 1, "y", 1, 1, 1, 1, 1])
+
+        with pytest.raises(KillSwitchError):
+            asyncio.run(test())
+
+    def test_await_batch_completion_order(self):
+        """Test `_await_batch` checks async states in the order they finish."""
+        from prefecto.concurrency.kill_switch import AnyFailedSwitch, KillSwitchError
+
+        async def finish(state, delay):
+            await asyncio.sleep(delay)
+            return state
+
+        slow, fast = MagicMock(), MagicMock()
+        slow.wait.side_effect = lambda: finish(states.Completed(), 10)
+        fast.wait.side_effect = lambda: finish(states.Failed(), 0)
+        bt = BatchTask(add, 2, AnyFailedSwitch())
+        with pytest.raises(KillSwitchError):
+            asyncio.run(asyncio.wait_for(bt._await_batch([slow, fast]), 5))
+
+    def test_await_batch_completion_order_sync(self):
+        """Test `_await_batch` checks sync states in the order they finish."""
+        from prefecto.concurrency.kill_switch import AnyFailedSwitch, KillSwitchError
+
+        release = threading.Event()
+
+        def finish_slow():
+            release.wait(5)
+            return states.Completed()
+
+        slow, fast = MagicMock(asynchronous=False), MagicMock(asynchronous=False)
+        slow.wait.side_effect = finish_slow
+        fast.wait.side_effect = states.Failed
+        bt = BatchTask(add, 2, AnyFailedSwitch())
+
+        async def raise_before_slow() -> bool:
+            try:
+                with pytest.raises(KillSwitchError):
+                    await bt._await_batch([slow, fast])
+                # The failure is raised while the slow wait is still blocked
+                return not release.is_set()
+            finally:
+                release.set()
+
+        assert asyncio.run(raise_before_slow())
+        slow.wait.assert_called_once()
+
+    def test_amap_async_task(self, harness):
+        """Test `BatchTask.amap` with an asynchronous task."""
+
+        @task
+        async def aadd(a, b):
+            """Add two numbers."""
+            return a + b
+
+        @flow
+        async def test() -> list[int]:
+            """Test flow."""
+            futures = await BatchTask(aadd, 2).amap([1, 2, 3], [2, 3, 4])
+            return [await f.result() for f in futures]
+
+        assert asyncio.run(test()) == [3, 5, 7]
+
+    def test_make_batches_numpy(self):
+        """Test `_make_batches` slices NumPy arrays into views."""
+        np = pytest.importorskip("numpy")
+        a = np.arange(5)
+        batches = list(BatchTask(add, 3)._make_batches(a=a, b=[2, 3, 4, 5, 6]))
+        assert [b["a"].tolist() for b in batches] == [[0, 1, 2], [3, 4]]
+        assert all(b["a"].base is a for b in batches)
+        assert [b["b"] for b in batches] == [[2, 3, 4], [5, 6]]
+
+    def test_make_batches_pandas(self):
+        """Test `_make_batches` slices pandas series by position."""
+        pd = pytest.importorskip("pandas")
+        a = pd.Series([1, 2, 3, 4, 5], index=[5, 4, 3, 2, 1])
+        batches = list(BatchTask(add, 3)._make_batches(a=a, b=unmapped(1)))
+        assert [b["a"].tolist() for b in batches] == [[1, 2, 3], [4, 5]]
+
+    def test_make_batches_polars(self):
+        """Test `_make_batches` slices Polars series."""
+        pl = pytest.importorskip("polars")
+        a = pl.Series([1, 2, 3, 4, 5])
+        batches = list(BatchTask(add, 3)._make_batches(a=a, b=unmapped(1)))
+        assert [b["a"].to_list() for b in batches] == [[1, 2, 3], [4, 5]]
@@ -31,3 +31,36 @@ async def test_rate_kill_switch():
     ks.raise_if_triggered(states.Failed())
     with pytest.raises(KillSwitchError):
         ks.raise_if_triggered(states.Crashed())
+
+
+def test_rate_kill_switch_min_sample():
+    ks = RateSwitch(3, 0.5)
+    ks.raise_if_triggered(states.Failed())
+    ks.raise_if_triggered(states.Failed())
+    with pytest.raises(KillSwitchError):
+        ks.raise_if_triggered(states.Completed())
+
+
+@pytest.mark.parametrize(
+    "ks",
+    [AnyFailedSwitch(), CountSwitch(2), RateSwitch(3, 0.5)],
+    ids=lambda ks: type(ks).__name__,
+)
+def test_kill_switch_slots(ks):
+    assert not hasattr(ks, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "min_sample,max_fail_rate,failures",
+    [(100, 0.07, 7), (25, 0.56, 14), (75, 0.68, 51)],
+)
+def test_rate_kill_switch_exact_threshold(
+    min_sample: int, max_fail_rate: float, failures: int
+):
+    ks = RateSwitch(min_sample, max_fail_rate)
+    for _ in range(min_sample - failures):
+        ks.raise_if_triggered(states.Completed())
+    for _ in range(failures - 1):
+        ks.raise_if_triggered(states.Failed())
+    with pytest.raises(KillSwitchError):
+        ks.raise_if_triggered(states.Failed())
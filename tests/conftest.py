@@ -8,8 +8,10 @@ import pytest
 from prefect.testing.utilities import prefect_test_harness
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def harness():
-    """Return a `prefect_test_harness`."""
+    """Return a `prefect_test_harness`. Shared by the whole session, since starting
+    the test database is the slowest part of the suite.
+    """
     with prefect_test_harness():
         yield
@@ -1,28 +1,86 @@
+import asyncio
 import re
 from typing import Union
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from prefect.blocks.system import Secret
 
-from prefecto.blocks import lazy_load, load_block
+from prefecto.blocks import LazyBlockProperty, lazy_load, load_block
 
+# Shared by reference, since blocks are not mutated by the tests
+_SECRET_FIXTURE = Secret(value="abc-123")
 
-def test_load_block():
 
+@pytest.fixture(autouse=True, scope="module")
+def secret_load():
+    """Patch `Secret.load` for every test in the module."""
     with patch(
-        "prefect.blocks.system.Secret.load", return_value=Secret(value="abc-123")
-    ):
-        block = load_block(Secret, "block")
-        assert isinstance(block, Secret)
-        assert block.get() == "abc-123"
+        "prefect.blocks.system.Secret.load", return_value=_SECRET_FIXTURE
+    ) as load:
+        yield load
+
+
+def test_load_block():
+    block = load_block(Secret, "block")
+    assert block is _SECRET_FIXTURE
+    assert block.value.get_secret_value() == "abc-123"
+
+
+@pytest.mark.asyncio
+async def test_load_block_in_event_loop():
+    block = load_block(Secret, "block")
+    assert asyncio.iscoroutine(block)
+    block = await block
+    assert isinstance(block, Secret)
+    assert block.value.get_secret_value() == "abc-123"
+
+
+@pytest.mark.asyncio
+async def test_load_block_sync_compatible_api():
+    assert load_block(Secret, "block", _sync=True) is _SECRET_FIXTURE
+    assert await load_block(Secret, "block", _sync=False) is _SECRET_FIXTURE
+    assert await load_block.aio(Secret, "block") is _SECRET_FIXTURE
 
 
 def test_lazy_load():
+    class Blocks:
+        password = "block"
 
-    with patch(
-        "prefect.blocks.system.Secret.load", return_value=Secret(value="abc-123")
-    ):
+        @property
+        @lazy_load("password")
+        def pw(self) -> Secret:
+            return load_block(Secret, getattr(self, "password"))
+
+    blocks = Blocks()
+    assert isinstance(blocks.pw, Secret)
+    assert blocks.pw.value.get_secret_value() == "abc-123"
+
+
+def test_lazy_load_descriptor(secret_load: MagicMock):
+    secret_load.reset_mock()
+
+    class Blocks:
+        password = "block"
+
+        @lazy_load("password")
+        def pw(self) -> Secret:
+            """The password block."""
+
+    assert isinstance(Blocks.pw, LazyBlockProperty)
+    assert Blocks.pw.__doc__ == "The password block."
+
+    blocks = Blocks()
+    assert isinstance(blocks.pw, Secret)
+    assert blocks.pw.value.get_secret_value() == "abc-123"
+    assert blocks.__dict__["pw"] is blocks.pw
+    secret_load.assert_called_once_with("block")
+
+
+def test_lazy_load_caches_falsy_block():
+    falsy = MagicMock()
+    falsy.__bool__.return_value = False
+    with patch("prefect.blocks.system.Secret.load", return_value=falsy) as load:
 
         class Blocks:
             password = "block"
@@ -33,8 +91,9 @@ def test_lazy_load():
                 return load_block(Secret, getattr(self, "password"))
 
         blocks = Blocks()
-        assert isinstance(blocks.pw, Secret)
-        assert blocks.pw.get() == "abc-123"
+        assert blocks.pw is falsy
+        assert blocks.pw is falsy
+        load.assert_called_once_with("block")
 
 
 def test_lazy_load_fail_on_union_return():
@@ -72,18 +131,22 @@ def test_lazy_load_fail_on_union_return():
 
 @pytest.mark.asyncio
 async def test_lazy_load_run_coro_return_val():
-    with patch(
-        "prefect.blocks.system.Secret.load", return_value=Secret(value="abc-123")
-    ):
-
-        class Blocks:
-            password = "block"
-
-            @property
-            @lazy_load("password")
-            def pw(self) -> Secret:
-                return load_block(Secret, getattr(self, "password"))
-
-        blocks = Blocks()
-        assert isinstance(blocks.pw, Secret)
-        assert blocks.pw.get() == "abc-123"
+    """Inside a running event loop `load_block` returns a coroutine, which the lazy
+    property must resolve to the block.
+    """
+
+    class Blocks:
+        password = "block"
+
+        @property
+        @lazy_load("password")
+        def pw(self) -> Secret:
+            return load_block(Secret, getattr(self, "password"))
+
+    blocks = Blocks()
+    coro = Blocks.pw.fget.__wrapped__(blocks)
+    assert asyncio.iscoroutine(coro)
+    coro.close()
+    assert isinstance(blocks.pw, Secret)
+    assert blocks.pw.value.get_secret_value() == "abc-123"
+    assert blocks.__dict__["_pw_block"] is blocks.pw
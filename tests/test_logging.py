@@ -6,14 +6,26 @@ from __future__ import annotations
 
 import logging
 
+from prefect import flow
+from prefect.logging.loggers import PrefectLogAdapter
+
 from prefecto.logging import get_prefect_or_default_logger
 
 
 def test_get_prefect_or_default_logger():
     """Tests `get_prefect_or_default_logger`."""
     assert get_prefect_or_default_logger().__class__ == logging.RootLogger
-    assert logging.getLogger("not root").__class__ == logging.Logger
-    assert (
-        get_prefect_or_default_logger(logging.Logger("not root")).__class__
-        == logging.Logger
-    )
+    not_root = logging.getLogger("not root")
+    assert not_root.__class__ == logging.Logger
+    assert get_prefect_or_default_logger(not_root) is not_root
+
+
+def test_get_prefect_or_default_logger_in_flow(harness):
+    """Tests `get_prefect_or_default_logger` returns the run logger in a flow."""
+
+    @flow
+    def get_logger():
+        return get_prefect_or_default_logger("not root")
+
+    assert isinstance(get_logger(), PrefectLogAdapter)
+    assert get_prefect_or_default_logger("not root").name == "not root"
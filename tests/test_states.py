@@ -0,0 +1,42 @@
+"""
+Tests for the states module.
+"""
+
+from __future__ import annotations
+
+import pytest
+from prefect import states
+
+from prefecto.states import is_fail_like, is_terminal
+
+
+@pytest.mark.parametrize(
+    "state,expectation",
+    [
+        (states.Cancelled(), True),
+        (states.Completed(), True),
+        (states.Crashed(), True),
+        (states.Failed(), True),
+        (states.Pending(), False),
+        (states.Running(), False),
+        (states.Scheduled(), False),
+    ],
+)
+def test_is_terminal(state: states.State, expectation: bool):
+    """Tests `is_terminal`."""
+    assert is_terminal(state) is expectation
+
+
+@pytest.mark.parametrize(
+    "state,expectation",
+    [
+        (states.Cancelled(), False),
+        (states.Completed(), False),
+        (states.Crashed(), True),
+        (states.Failed(), True),
+        (states.Running(), False),
+    ],
+)
+def test_is_fail_like(state: states.State, expectation: bool):
+    """Tests `is_fail_like`."""
+    assert is_fail_like(state) is expectation